@@ -76,7 +76,7 @@ class Container(Component):
         super().__init__(id=id, script=script, style=style)
         
         # Convert single component to list
-        self.children = [children] if isinstance(children, Component) else children
+        self.extend_children([children] if isinstance(children, Component) else children)
         
         self.display = display
         self.flex_direction = flex_direction
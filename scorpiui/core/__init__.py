@@ -1,5 +1,5 @@
 from .events import register_event, handle_component_event, emit_state_change
-from .renderer import run_app
+from .renderer import run_app, init_socketio
 from .state import StateNotifier, ComponentState, global_state
 
 __all__ = [
@@ -7,6 +7,7 @@ __all__ = [
     'handle_component_event',
     'emit_state_change',
     'run_app',
+    'init_socketio',
     'StateNotifier',
     'ComponentState',
     'global_state'
@@ -0,0 +1,11 @@
+"""
+Compatibility Module
+
+This module provides helpers for features that depend on the Python version.
+"""
+
+import sys
+
+# dataclass(slots=True) is only available from Python 3.10; use as
+# @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
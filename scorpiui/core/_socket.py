@@ -0,0 +1,16 @@
+"""
+Socket Module
+
+This module gives the core modules access to the renderer's SocketIO server.
+"""
+
+# The renderer's SocketIO server, imported on first use since the renderer
+# itself imports the events module
+_socketio = None
+
+def get_socketio():
+    """Get the renderer's SocketIO server, importing it on first use."""
+    global _socketio
+    if _socketio is None:
+        from .renderer import socketio as _socketio
+    return _socketio
@@ -5,16 +5,20 @@ This module provides the base component class that all ScorpiUI components inher
 It includes lifecycle methods and state management functionality.
 """
 
-import uuid
-import json
+import io
+import collections
+import os
+import sys
 import logging
+import itertools
+import time
+import warnings
 import asyncio
-import inspect
-from typing import Any, Callable, Dict, List, Optional, Union, TypeVar, Generic
-from enum import Enum
+from enum import IntEnum
+from types import FunctionType, MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, TypeVar
 from functools import wraps
-from dataclasses import dataclass, field
-from .state_binding import StateBinding
+from . import state_binding
 from .events import register_event
 
 # Configure logging
@@ -22,29 +26,56 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')  # For generic types
 
-@dataclass
-class ComponentContext:
-    """Context object passed to components during lifecycle methods."""
-    id: str
-    props: Dict = field(default_factory=dict)
-    state: Dict = field(default_factory=dict)
-    slots: Dict[str, 'Component'] = field(default_factory=dict)
-    refs: Dict[str, 'Component'] = field(default_factory=dict)
-    parent: Optional['Component'] = None
-    is_mounted: bool = False
-    is_updating: bool = False
-    update_count: int = 0
+# Sentinel for state keys that are not set
+_MISSING = object()
 
-class ComponentLifecycle(Enum):
-    """Enum representing the different lifecycle states of a component."""
-    CREATED = "created"
-    BEFORE_MOUNT = "before_mount"
-    MOUNTED = "mounted"
-    BEFORE_UPDATE = "before_update"
-    UPDATED = "updated"
-    BEFORE_UNMOUNT = "before_unmount"
-    UNMOUNTED = "unmounted"
-    ERROR = "error"
+# Component ids only need to be unique within the process, so they are
+# built from a per-process prefix and a counter instead of uuid4().
+_ID_PREFIX = f"c{os.getpid():x}{int(time.time()):x}-"
+_id_counter = itertools.count()
+
+def _next_id(secure: bool = False) -> str:
+    """
+    Generate a new component id.
+    
+    Args:
+        secure: Use an unguessable uuid4 based id instead of the counter
+        
+    Returns:
+        str: The generated id
+    """
+    if secure:
+        import uuid
+        return uuid.uuid4().hex
+    return f"{_ID_PREFIX}{next(_id_counter):x}"
+
+# Lifecycle states of a component, stored as plain ints on lifecycle_state
+CREATED: Final = 0
+BEFORE_MOUNT: Final = 1
+MOUNTED: Final = 2
+BEFORE_UPDATE: Final = 3
+UPDATED: Final = 4
+BEFORE_UNMOUNT: Final = 5
+UNMOUNTED: Final = 6
+ERROR: Final = 7
+
+class ComponentLifecycle(IntEnum):
+    """
+    Lifecycle states of a component.
+    
+    Components store the plain int constants above on ``lifecycle_state``;
+    being an IntEnum, members compare equal to those ints, so
+    ``ComponentLifecycle(component.lifecycle_state)`` gives a readable
+    value for inspection.
+    """
+    CREATED = CREATED
+    BEFORE_MOUNT = BEFORE_MOUNT
+    MOUNTED = MOUNTED
+    BEFORE_UPDATE = BEFORE_UPDATE
+    UPDATED = UPDATED
+    BEFORE_UNMOUNT = BEFORE_UNMOUNT
+    UNMOUNTED = UNMOUNTED
+    ERROR = ERROR
 
 class ComponentError(Exception):
     """Base exception for component-related errors."""
@@ -60,12 +91,80 @@ class PropError(ComponentError):
 
 def lifecycle_log(func):
     """Decorator to log lifecycle method calls."""
+    name = func.__name__
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        logger.debug(f"{self.__class__.__name__}({self.id}) - {func.__name__} called")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s(%s) - %s called", type(self).__name__, self.id, name)
         return func(self, *args, **kwargs)
     return wrapper
 
+def computed_property(deps):
+    """
+    Decorator declaring the state keys a compute_<name> method depends on.
+    
+    The cached value is only dropped when one of these keys changes;
+    undecorated compute methods are invalidated on every state change.
+    
+    Example:
+        @computed_property(deps=('first_name', 'last_name'))
+        def compute_full_name(self):
+            return f"{self.state['first_name']} {self.state['last_name']}"
+    """
+    deps = frozenset(deps)
+    def decorator(func):
+        func._computed_deps = deps
+        return func
+    return decorator
+
+def _lifecycle_guard(func):
+    """Decorator routing errors raised by a lifecycle method to the component's error handling."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except Exception as e:
+            self._handle_error(e)
+    return wrapper
+
+# Component attributes that mixins merge into instead of replacing
+_MIXIN_MERGE_KEYS = frozenset(('_props', '_state', '_computed_cache'))
+
+# Binding type -> (memoized binding function, names of the extra kwargs it takes)
+_BINDERS = {
+    'text': (state_binding.bind_to_text, ()),
+    'value': (state_binding.bind_to_value, ()),
+    'attribute': (state_binding.bind_to_attribute, ('attribute',)),
+    'style': (state_binding.bind_to_style, ('style_property',)),
+    'transform': (state_binding.bind_with_transform, ('transform',)),
+}
+
+# JavaScript templates for component scripts; _HANDLER_TMPL is split on its %s
+# placeholders into shared pieces, _MOUNT_TMPL uses str.format
+_HANDLER_TMPL = """
+    document.getElementById('%s').addEventListener('%s', function(event) {
+        ScorpiUI.emit('%s', {
+            value: event.target.value,
+            checked: event.target.checked,
+            type: event.type,
+            meta: {
+                componentId: '%s',
+                eventName: '%s'
+            }
+        });
+    });
+"""
+_HANDLER_PARTS = tuple(_HANDLER_TMPL.split('%s'))
+
+_MOUNT_TMPL = """
+    document.addEventListener('DOMContentLoaded', function() {{
+        const element = document.getElementById('{id}');
+        if (element) {{
+            ScorpiUI.emit('{id}_mount');
+        }}
+    }});
+"""
+
 class Component:
     """
     Enhanced base component class with features from popular frameworks.
@@ -83,8 +182,43 @@ class Component:
     - Props validation (inspired by Vue/React)
     - State management with history (inspired by Redux)
     - Effects system (inspired by React)
+    
+    Component declares __slots__ for its own attributes; subclasses that
+    don't declare __slots__ keep a __dict__ for their extra attributes.
     """
     
+    __slots__ = (
+        'id', 'key', 'bindings', '_bindings_joined', '_bindings_count', '_style', '_style_block', 'lifecycle_state', '_parent', 'children',
+        '_script', '_script_cache', '_script_dirty', '_mount_script', '_event_names', '_event_ids',
+        '_props', '_state', '_prev_state', '_computed_cache', '_watchers',
+        '_effects', '_cleanup_handlers', '_error_boundary', '_provided', '_context_map',
+        'is_mounted', 'is_updating', 'update_count',
+        '_slots', '_refs', '_mixins', '_suspense', '__weakref__'
+    )
+    
+    # Computed property name -> frozenset of state keys it depends on, or None
+    # if undeclared (invalidated on any change); filled by __init_subclass__
+    _computed_deps: Dict[str, Optional[frozenset]] = {}
+    
+    # Number of previous states kept for undo_state; 0 disables history
+    MAX_HISTORY = 32
+    
+    # (prop name, expected type) pairs from the class's prop_types, if any
+    _prop_type_items = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Precompute per-class prop type checks and computed property dependencies."""
+        super().__init_subclass__(**kwargs)
+        prop_types = getattr(cls, 'prop_types', None)
+        cls._prop_type_items = tuple(prop_types.items()) if prop_types else ()
+        
+        computed_deps = {}
+        for klass in reversed(cls.__mro__):
+            for attr, value in vars(klass).items():
+                if attr.startswith('compute_') and callable(value):
+                    computed_deps[attr[len('compute_'):]] = getattr(value, '_computed_deps', None)
+        cls._computed_deps = computed_deps
+    
     def __init__(
         self,
         id: Optional[str] = None,
@@ -92,60 +226,135 @@ class Component:
         style: Optional[str] = None,
         props: Dict = None,
         slots: Dict[str, 'Component'] = None,
-        mixins: List[Dict] = None
+        mixins: List[Dict] = None,
+        secure_id: bool = False
     ):
-        """Initialize the component with enhanced features."""
-        self.id = id if id else uuid.uuid4().hex
+        """
+        Initialize the component with enhanced features.
+        
+        If no id is given, a process-unique id is generated; pass
+        secure_id=True to get an unguessable uuid4 based id instead.
+        """
+        self.id = id if id else _next_id(secure_id)
         self.key = self.id
+        self._mount_script = _MOUNT_TMPL.format_map({'id': self.id})
         self.bindings = []
+        # '\n'-joined bindings and the number of entries it covers; rebuilt by
+        # _sync_bindings when the public list was changed directly
+        self._bindings_joined = ''
+        self._bindings_count = 0
+        self._script_cache = ""
+        self._script_dirty = True
         self.script = script
         self.style = style
-        self.event_handlers = {}
-        self.lifecycle_state = ComponentLifecycle.CREATED
-        self.parent = None
+        # Event lists are allocated on the first on()/on_many() call
+        self._event_names = None
+        self._event_ids = None
+        self.lifecycle_state = CREATED
+        self._parent = None
         self.children = []
         self._props = props or {}
         self._state = {}
-        self._prev_state = []  # State history for undo/redo
+        # Rarely used containers are allocated on first use
+        self._prev_state = None  # State history for undo, see MAX_HISTORY
         self._computed_cache = {}
-        self._watchers = {}
-        self._effects = []
-        self._cleanup_handlers = []
+        self._watchers = None
+        self._effects = None
+        self._cleanup_handlers = None
         self._error_boundary = None
-        self._context = ComponentContext(
-            id=self.id,
-            props=self._props,
-            state=self._state
-        )
+        self._provided = None
+        self._context_map = None
+        self.is_mounted = False
+        self.is_updating = False
+        self.update_count = 0
         self._slots = slots or {}
-        self._refs = {}
-        self._mixins = []
+        self._refs = None
+        self._mixins = None
         self._suspense = None
         
         # Apply mixins
         if mixins:
             self._apply_mixins(mixins)
         
-        try:
-            self.on_created()
-        except Exception as e:
-            self._handle_error(e)
+        self._created()
     
     def _apply_mixins(self, mixins: List[Dict]):
         """Apply mixins to the component."""
+        # Names already defined on the instance or its class; methods never override these
+        own_attrs = set(getattr(self, '__dict__', ()))
+        for klass in type(self).__mro__:
+            own_attrs.update(vars(klass))
+        merges = {}
+        if self._mixins is None:
+            self._mixins = []
         for mixin in mixins:
             for key, value in mixin.items():
                 if callable(value):
                     # Don't override existing methods
-                    if not hasattr(self, key):
-                        setattr(self, key, value.__get__(self, self.__class__))
-                else:
-                    # Merge dictionaries for certain attributes
-                    if key in ['_props', '_state', '_computed_cache']:
-                        getattr(self, key).update(value)
-                    else:
+                    if key not in own_attrs:
+                        if isinstance(value, FunctionType):
+                            value = value.__get__(self, self.__class__)
                         setattr(self, key, value)
+                        own_attrs.add(key)
+                elif key in _MIXIN_MERGE_KEYS:
+                    # Merge dictionaries for certain attributes
+                    merges.setdefault(key, {}).update(value)
+                else:
+                    setattr(self, key, value)
+                    own_attrs.add(key)
             self._mixins.append(mixin)
+        for key, value in merges.items():
+            getattr(self, key).update(value)
+    
+    @property
+    def parent(self) -> Optional['Component']:
+        """Get the parent component."""
+        return self._parent
+    
+    @parent.setter
+    def parent(self, value: Optional['Component']):
+        """Set the parent component, dropping context copied from the old one."""
+        if value is not self._parent:
+            self._parent = value
+            self._reset_context()
+    
+    @property
+    def script(self) -> Optional[str]:
+        """Get the component's custom script."""
+        return self._script
+    
+    @script.setter
+    def script(self, value: Optional[str]):
+        """Set the custom script and invalidate the cached script block."""
+        self._script = value
+        self._script_dirty = True
+    
+    @property
+    def style(self) -> Optional[str]:
+        """Get the component's custom CSS."""
+        return self._style
+    
+    @style.setter
+    def style(self, value: Optional[str]):
+        """Set the custom CSS and pre-build the <style> block returned by get_style."""
+        self._style = value
+        self._style_block = f"<style>\n{value}\n</style>" if value else ""
+    
+    @property
+    def event_handlers(self) -> Mapping[str, str]:
+        """
+        Get a read-only mapping of event name to event id.
+        
+        Deprecated: events are stored as parallel lists; register them with
+        ``on``. The mapping is a snapshot, so writing to it raises TypeError
+        rather than silently losing the handler.
+        """
+        warnings.warn(
+            "Component.event_handlers is deprecated; use Component.on to register events",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return MappingProxyType(dict(zip(self._event_names or (), self._event_ids or ())))
     
     @property
     def props(self) -> Dict:
@@ -155,21 +364,20 @@ class Component:
     @props.setter
     def props(self, value: Dict):
         """Set props with validation."""
-        if hasattr(self, 'prop_types'):
+        if self._prop_type_items:
             self._validate_props(value)
         self._props = value
     
     def _validate_props(self, props: Dict):
         """Validate props against prop_types."""
-        if hasattr(self, 'prop_types'):
-            for name, value in props.items():
-                if name in self.prop_types:
-                    expected_type = self.prop_types[name]
-                    if not isinstance(value, expected_type):
-                        raise PropError(
-                            f"Prop '{name}' expected type {expected_type.__name__}, "
-                            f"got {type(value).__name__}"
-                        )
+        for name, expected_type in self._prop_type_items:
+            if name in props:
+                value = props[name]
+                if not isinstance(value, expected_type):
+                    raise PropError(
+                        f"Prop '{name}' expected type {expected_type.__name__}, "
+                        f"got {type(value).__name__}"
+                    )
     
     @property
     def state(self) -> Dict:
@@ -180,30 +388,52 @@ class Component:
         """
         Update state with history tracking.
         
+        At most MAX_HISTORY previous states are kept for undo_state. Updates
+        that change no value are ignored: no history entry, watchers, effects
+        or on_update call. The old_state passed to on_update only holds the
+        previous values of the keys that changed.
+        
         Args:
             new_state: New state to merge
             save_history: Whether to save state in history
         """
-        if save_history:
-            self._prev_state.append(self._state.copy())
-        old_state = self._state.copy()
-        self._state.update(new_state)
+        state = self._state
+        changed = []
+        for k, v in new_state.items():
+            current = state.get(k, _MISSING)
+            if current is not v and current != v:
+                changed.append(k)
+        if not changed:
+            return
+        
+        if save_history and self.MAX_HISTORY:
+            if self._prev_state is None:
+                self._prev_state = collections.deque(maxlen=self.MAX_HISTORY)
+            self._prev_state.append(dict(state))
+        old_state = {k: state[k] for k in changed if k in state}
+        state.update(new_state)
         
         # Trigger watchers
-        self._trigger_watchers(old_state)
+        self._trigger_watchers(old_state, changed)
         
         # Trigger effects
-        self._trigger_effects()
+        self._trigger_effects(changed)
         
-        # Update computed cache
-        self._update_computed()
+        # Drop computed values that depend on the changed keys
+        if changed and self._computed_cache:
+            self._invalidate_computed(changed)
         
         self.on_update(old_state=old_state)
     
     def undo_state(self):
         """Undo last state change."""
         if self._prev_state:
-            self._state = self._prev_state.pop()
+            current = self._state
+            restored = self._state = self._prev_state.pop()
+            if self._computed_cache:
+                changed = [k for k in current.keys() | restored.keys()
+                           if current.get(k, _MISSING) != restored.get(k, _MISSING)]
+                self._invalidate_computed(changed)
             self.on_update()
     
     def computed(self, name: str) -> Any:
@@ -213,18 +443,46 @@ class Component:
                 self._computed_cache[name] = getattr(self, f'compute_{name}')()
         return self._computed_cache[name]
     
+    def _invalidate_computed(self, changed: List[str]):
+        """
+        Evict cached computed values whose dependencies include a changed key.
+        
+        Names without declared dependencies, including compute methods added
+        by mixins (which the class-level table doesn't know about), are
+        evicted on any change.
+        """
+        cache = self._computed_cache
+        computed_deps = self._computed_deps
+        for name in list(cache):
+            deps = computed_deps.get(name)
+            if deps is None or not deps.isdisjoint(changed):
+                del cache[name]
+    
     def watch(self, state_key: str, handler: Callable):
         """Add a watcher for a state key."""
-        if state_key not in self._watchers:
-            self._watchers[state_key] = []
-        self._watchers[state_key].append(handler)
-    
-    def _trigger_watchers(self, old_state: Dict):
-        """Trigger watchers for changed state keys."""
-        for key, handlers in self._watchers.items():
-            if key in self._state and (key not in old_state or old_state[key] != self._state[key]):
+        if self._watchers is None:
+            self._watchers = {}
+        self._watchers.setdefault(state_key, []).append(handler)
+    
+    def _trigger_watchers(self, old_state: Dict, changed: List[str] = None):
+        """
+        Trigger watchers for changed state keys.
+        
+        Args:
+            old_state: State before the update
+            changed: Keys whose value changed; computed from old_state if omitted
+        """
+        watchers = self._watchers
+        if not watchers:
+            return
+        state = self._state
+        if changed is None:
+            changed = [k for k, v in state.items() if old_state.get(k, _MISSING) != v]
+        for key in changed:
+            handlers = watchers.get(key)
+            if handlers:
                 for handler in handlers:
-                    handler(self._state[key], old_state.get(key))
+                    handler(state[key], old_state.get(key))
     
     def effect(self, effect_fn: Callable, dependencies: List[str] = None):
         """
@@ -234,44 +492,110 @@ class Component:
             effect_fn: Effect function that returns cleanup function
             dependencies: List of state keys this effect depends on
         """
+        if self._effects is None:
+            self._effects = []
         self._effects.append({
             'fn': effect_fn,
             'deps': dependencies,
+            'deps_set': frozenset(dependencies) if dependencies else None,
             'cleanup': None
         })
     
-    def _trigger_effects(self):
-        """Trigger effects whose dependencies have changed."""
-        for effect in self._effects:
-            should_run = True
-            if effect['deps']:
-                should_run = any(
-                    key in self._state for key in effect['deps']
-                )
+    def _trigger_effects(self, changed: List[str] = None):
+        """
+        Trigger effects whose dependencies have changed.
+        
+        Args:
+            changed: Keys whose value changed; if omitted (e.g. on mount) all effects run
+        """
+        for effect in self._effects or ():
+            deps_set = effect['deps_set']
+            if changed is not None and deps_set is not None and deps_set.isdisjoint(changed):
+                continue
             
-            if should_run:
-                # Cleanup previous effect
-                if effect['cleanup']:
-                    effect['cleanup']()
-                # Run effect and store cleanup
-                effect['cleanup'] = effect['fn']()
+            # Cleanup previous effect
+            if effect['cleanup']:
+                effect['cleanup']()
+            # Run effect and store cleanup
+            effect['cleanup'] = effect['fn']()
     
     def create_ref(self, initial_value: Any = None) -> Dict:
         """Create a ref object (similar to React useRef)."""
         ref = {'current': initial_value}
-        self._refs[uuid.uuid4().hex] = ref
+        if self._refs is None:
+            self._refs = {}
+        self._refs[_next_id()] = ref
         return ref
     
     def provide(self, key: str, value: Any):
         """Provide context value to child components."""
-        self._context.provide = {key: value}
+        if self._provided is None:
+            self._provided = {}
+        self._provided[key] = value
+        if self._context_map is not None:
+            self._context_map[key] = value
+        # Descendants copied the old value into their maps
+        for child in self.children:
+            if isinstance(child, Component):
+                child._reset_context()
+    
+    def _reset_context(self):
+        """Drop the flattened context maps of this component and its descendants."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._context_map = None
+            for child in node.children:
+                if isinstance(child, Component):
+                    stack.append(child)
+    
+    def _inherit_context(self):
+        """
+        Flatten the parent's context map and this component's provided
+        values into a single dict, so consume() is a plain lookup.
+        
+        Called at the start of render; parents render before their children,
+        so the parent's map is already built by then. The maps of a subtree
+        are dropped again when it is moved to another parent or an ancestor
+        provides a new value.
+        """
+        parent = self.parent
+        inherited = parent._context_map if parent is not None else None
+        if inherited is None and parent is not None:
+            inherited = parent._collect_context()
+        context_map = dict(inherited) if inherited else {}
+        if self._provided:
+            context_map.update(self._provided)
+        self._context_map = context_map
+    
+    def _collect_context(self) -> Dict[str, Any]:
+        """Build the effective context of an unrendered component by walking its ancestors."""
+        chain = []
+        component = self
+        while component is not None:
+            if component._context_map is not None:
+                chain.append(component._context_map)
+                break
+            if component._provided:
+                chain.append(component._provided)
+            component = component.parent
+        context_map = {}
+        for provided in reversed(chain):
+            context_map.update(provided)
+        return context_map
         
     def consume(self, key: str) -> Any:
         """Consume context value from parent component."""
+        context_map = self._context_map
+        if context_map is not None and key in context_map:
+            return context_map[key]
+        # Not rendered yet, or the key was provided in a way the map can't
+        # see (e.g. a parent assigned directly): read the live ancestor chain
         component = self
         while component:
-            if hasattr(component._context, 'provide') and key in component._context.provide:
-                return component._context.provide[key]
+            provided = component._provided
+            if provided is not None and key in provided:
+                return provided[key]
             component = component.parent
         raise ComponentError(f"Context key '{key}' not found in component hierarchy")
     
@@ -281,11 +605,20 @@ class Component:
         
         Args:
             promise: Async operation to wait for
+            
+        Returns:
+            The result of the promise
         """
+        promise = asyncio.ensure_future(promise)
+        if promise.done():
+            return promise.result()
         self._suspense = promise
-        try:
-            await promise
-        finally:
+        promise.add_done_callback(self._clear_suspense)
+        return await promise
+    
+    def _clear_suspense(self, promise: asyncio.Future):
+        """Leave the suspended state once the awaited promise settles."""
+        if self._suspense is promise:
             self._suspense = None
     
     def error_boundary(self, error_component: 'Component'):
@@ -294,7 +627,7 @@ class Component:
     
     def _handle_error(self, error: Exception):
         """Handle component error with boundaries."""
-        self.lifecycle_state = ComponentLifecycle.ERROR
+        self.lifecycle_state = ERROR
         if self._error_boundary:
             self._error_boundary.state = {'error': str(error)}
         else:
@@ -304,21 +637,25 @@ class Component:
             else:
                 raise error
     
+    @_lifecycle_guard
+    def _created(self):
+        """Run the on_created hook, routing errors to the error boundary."""
+        self.on_created()
+    
     @lifecycle_log
     def on_created(self):
         """Called after component is created."""
-        logger.debug(f"Component {self.id} created")
     
     @lifecycle_log
     def before_mount(self):
         """Called before component is mounted."""
-        self.lifecycle_state = ComponentLifecycle.BEFORE_MOUNT
+        self.lifecycle_state = BEFORE_MOUNT
     
     @lifecycle_log
     def on_mount(self):
         """Called after component is mounted."""
-        self.lifecycle_state = ComponentLifecycle.MOUNTED
-        self._context.is_mounted = True
+        self.lifecycle_state = MOUNTED
+        self.is_mounted = True
         
         # Run initial effects
         self._trigger_effects()
@@ -326,48 +663,115 @@ class Component:
     @lifecycle_log
     def before_update(self, old_props: Dict = None, old_state: Dict = None):
         """Called before component updates."""
-        self.lifecycle_state = ComponentLifecycle.BEFORE_UPDATE
-        self._context.is_updating = True
+        self.lifecycle_state = BEFORE_UPDATE
+        self.is_updating = True
     
     @lifecycle_log
     def on_update(self, old_props: Dict = None, old_state: Dict = None):
         """Called after component updates."""
-        self.lifecycle_state = ComponentLifecycle.UPDATED
-        self._context.is_updating = False
-        self._context.update_count += 1
+        self.lifecycle_state = UPDATED
+        self.is_updating = False
+        self.update_count += 1
     
     @lifecycle_log
     def before_unmount(self):
         """Called before component unmounts."""
-        self.lifecycle_state = ComponentLifecycle.BEFORE_UNMOUNT
+        self.lifecycle_state = BEFORE_UNMOUNT
     
+    @_lifecycle_guard
     @lifecycle_log
     def on_unmount(self):
-        """Called when component unmounts."""
-        try:
-            self.before_unmount()
-            
-            # Run cleanup handlers
-            for cleanup in self._cleanup_handlers:
-                try:
-                    cleanup()
-                except Exception as e:
-                    logger.error(f"Error in cleanup handler: {str(e)}")
-            
-            # Clean up effects
-            for effect in self._effects:
-                if effect['cleanup']:
-                    effect['cleanup']()
-            
-            # Clean up children
-            for child in self.children:
-                child.on_unmount()
-            
-            self.lifecycle_state = ComponentLifecycle.UNMOUNTED
-            self._context.is_mounted = False
-            
-        except Exception as e:
-            self._handle_error(e)
+        """
+        Called when component unmounts; unmounts all descendants as well.
+        
+        The subtree is walked iteratively rather than by recursing into each
+        child's on_unmount, so deep trees don't hit the recursion limit.
+        Per-component cleanup runs parent-first, then components are marked
+        unmounted children-first. A descendant whose class overrides
+        on_unmount has its override called instead, and unmounts its own
+        subtree from there.
+        """
+        # Collect the subtree in pre-order as (node, overrides on_unmount)
+        # pairs, without descending into overriding descendants
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            overrides = node is not self and type(node).on_unmount is not Component.on_unmount
+            nodes.append((node, overrides))
+            if overrides:
+                continue
+            children = node.children
+            for i in range(len(children) - 1, -1, -1):
+                child = children[i]
+                if isinstance(child, Component):
+                    stack.append(child)
+        
+        for node, overrides in nodes:
+            if overrides:
+                node.on_unmount()
+            else:
+                node._unmount_self()
+        
+        for node, _ in reversed(nodes):
+            node.lifecycle_state = UNMOUNTED
+            node.is_mounted = False
+    
+    @_lifecycle_guard
+    def _unmount_self(self):
+        """Run this component's unmount hook, cleanup handlers and effect cleanups."""
+        self.before_unmount()
+        
+        # Run cleanup handlers
+        for cleanup in self._cleanup_handlers or ():
+            try:
+                cleanup()
+            except Exception as e:
+                logger.error("Error in cleanup handler: %s", e)
+        
+        # Clean up effects
+        for effect in self._effects or ():
+            if effect['cleanup']:
+                effect['cleanup']()
+    
+    def add_cleanup(self, handler: Callable):
+        """Register a function to run when the component unmounts."""
+        if self._cleanup_handlers is None:
+            self._cleanup_handlers = []
+        self._cleanup_handlers.append(handler)
+    
+    def add_child(self, child: 'Component'):
+        """Add a child component."""
+        child.parent = self
+        self.children.append(child)
+    
+    def extend_children(self, children):
+        """
+        Add several child components at once.
+        
+        Args:
+            children: Iterable of child components; non-component items
+                (e.g. raw HTML strings) are added without parent linking
+        """
+        children = list(children)
+        for child in children:
+            if isinstance(child, Component):
+                child.parent = self
+        self.children.extend(children)
+    
+    def remove_child(self, child: 'Component'):
+        """Unmount and remove a child component; does nothing if it isn't a child."""
+        # Match by identity: ids are user-supplied and may repeat, and
+        # Component doesn't define __eq__ beyond identity anyway
+        children = self.children
+        for i, existing in enumerate(children):
+            if existing is child:
+                break
+        else:
+            return
+        del children[i]
+        child.on_unmount()
+        child.parent = None
     
     def slot(self, name: str = 'default') -> Optional['Component']:
         """Get slot content by name."""
@@ -385,14 +789,27 @@ class Component:
         raise NotImplementedError("Components must implement template method")
     
     def render(self) -> str:
-        """Render the component with lifecycle hooks."""
+        """
+        Render the component with lifecycle hooks.
+        
+        The first render runs the mount hooks; later renders of a mounted
+        component run the update hooks instead, so mount effects don't fire
+        again on every render.
+        """
         try:
             if self._suspense:
                 return self._render_loading()
             
-            self.before_mount()
-            rendered = self.template()
-            self.on_mount()
+            if self._context_map is None:
+                self._inherit_context()
+            if not self.is_mounted:
+                self.before_mount()
+                rendered = self.template()
+                self.on_mount()
+            else:
+                self.before_update()
+                rendered = self.template()
+                self.on_update()
             
             return rendered
         except Exception as e:
@@ -409,6 +826,64 @@ class Component:
         """Get the component's key (alias for ID)."""
         return self.key
     
+    def _init_event_lists(self):
+        """Allocate the per-event lists on first event registration."""
+        self._event_names = []
+        self._event_ids = []
+    
+    def on(self, event_name: str, handler: Callable) -> 'Component':
+        """
+        Register an event handler for a DOM event on this component.
+        
+        Args:
+            event_name (str): DOM event to listen for (e.g., 'click', 'change')
+            handler (Callable): Function called with the EventData of the event
+            
+        Returns:
+            Component: The component itself, for chaining
+        """
+        event_name = sys.intern(event_name)
+        event_id = f"{self.id}_{event_name}"
+        register_event(event_id, handler)
+        if self._event_names is None:
+            self._init_event_lists()
+        if event_name not in self._event_names:
+            self._event_names.append(event_name)
+            self._event_ids.append(event_id)
+            self._script_dirty = True
+        return self
+    
+    def on_many(self, events: Dict[str, Callable]) -> 'Component':
+        """
+        Register several event handlers at once.
+        
+        Equivalent to chaining ``on`` for each item, but resolves the event
+        lists once and invalidates the cached script a single time.
+        
+        Args:
+            events (Dict[str, Callable]): Mapping of DOM event name to handler
+            
+        Returns:
+            Component: The component itself, for chaining
+        """
+        if self._event_names is None:
+            self._init_event_lists()
+        event_names = self._event_names
+        event_ids = self._event_ids
+        prefix = self.id + "_"
+        added = False
+        for event_name, handler in events.items():
+            event_name = sys.intern(event_name)
+            event_id = prefix + event_name
+            register_event(event_id, handler)
+            if event_name not in event_names:
+                event_names.append(event_name)
+                event_ids.append(event_id)
+                added = True
+        if added:
+            self._script_dirty = True
+        return self
+    
     def bind_state(self, state_name: str, binding_type: str = 'text', **kwargs):
         """
         Bind a state to this component.
@@ -416,30 +891,32 @@ class Component:
         Args:
             state_name (str): Name of the state to bind
             binding_type (str): Type of binding ('text', 'value', 'attribute', 'style', or 'transform')
-            **kwargs: Additional arguments for the binding
+            **kwargs: Additional arguments for the binding ('attribute', 'style_property'
+                or 'transform', required by the matching binding type)
+                
+        Raises:
+            ValueError: If binding_type is unknown
+            TypeError: If the kwarg required by binding_type is missing
         """
+        binding_type = sys.intern(binding_type)
+        spec = _BINDERS.get(binding_type)
+        if spec is None:
+            raise ValueError(f"Unknown binding type: {binding_type}")
         try:
-            if binding_type == 'text':
-                binding = StateBinding.bind_to_text(state_name, self.id)
-            elif binding_type == 'value':
-                binding = StateBinding.bind_to_value(state_name, self.id)
-            elif binding_type == 'attribute':
-                binding = StateBinding.bind_to_attribute(state_name, self.id, kwargs.get('attribute'))
-            elif binding_type == 'style':
-                binding = StateBinding.bind_to_style(state_name, self.id, kwargs.get('style_property'))
-            elif binding_type == 'transform':
-                binding = StateBinding.bind_with_transform(state_name, self.id, kwargs.get('transform'))
-            else:
-                raise ValueError(f"Unknown binding type: {binding_type}")
-                
-            self.bindings.append(binding)
+            binding = spec[0](state_name, self.id, *[kwargs[k] for k in spec[1]])
+        except KeyError as e:
+            raise TypeError(
+                f"Missing required kwarg {e.args[0]!r} for binding type {binding_type!r}"
+            ) from None
             
-            # Set up a watcher for this state
-            self.watch(state_name, lambda new_val, _: self._handle_state_change(state_name, new_val))
-            
-        except Exception as e:
-            logger.error(f"Error binding state {state_name} to component {self.id}: {str(e)}")
-            raise
+        self._sync_bindings()
+        self.bindings.append(binding)
+        self._bindings_joined = self._bindings_joined + '\n' + binding if self._bindings_joined else binding
+        self._bindings_count += 1
+        self._script_dirty = True
+        
+        # Set up a watcher for this state
+        self.watch(state_name, lambda new_val, _: self._handle_state_change(state_name, new_val))
     
     def _handle_state_change(self, state_name: str, new_value: Any):
         """Handle state changes for bindings."""
@@ -448,66 +925,76 @@ class Component:
             if state_name not in self._state or self._state[state_name] != new_value:
                 self.set_state({state_name: new_value}, save_history=False)
         except Exception as e:
-            logger.error(f"Error handling state change for {state_name}: {str(e)}")
+            logger.error("Error handling state change for %s: %s", state_name, e)
             raise
     
+    def _sync_bindings(self):
+        """Rebuild the joined bindings if the bindings list was changed directly."""
+        bindings = self.bindings
+        if len(bindings) != self._bindings_count:
+            self._bindings_joined = '\n'.join(bindings)
+            self._bindings_count = len(bindings)
+            self._script_dirty = True
+    
     def get_bindings(self) -> str:
         """Get all state bindings for this component."""
-        return "\n".join(self.bindings)
+        self._sync_bindings()
+        return self._bindings_joined
 
     def get_script(self) -> str:
         """
         Get the component's JavaScript code including bindings and event handlers.
         
+        The generated block is cached and only rebuilt after ``on``,
+        ``bind_state``, an assignment to ``script`` or a change in the number
+        of entries in ``bindings``.
+        
         Returns:
             str: Combined JavaScript code from bindings, event handlers, and custom script
         """
-        try:
-            script_parts = []
+        self._sync_bindings()
+        if not self._script_dirty:
+            return self._script_cache
+        buf = io.StringIO()
+        buf.write("<script>\n")
+        
+        # Add bindings
+        if self._bindings_joined:
+            buf.write(self._bindings_joined)
+            buf.write("\n")
+        
+        # Add event handlers
+        if self._event_names:
+            component_id = self.id
+            p0, p1, p2, p3, p4, p5 = _HANDLER_PARTS
+            for event_name, event_id in zip(self._event_names, self._event_ids):
+                buf.write(p0)
+                buf.write(component_id)
+                buf.write(p1)
+                buf.write(event_name)
+                buf.write(p2)
+                buf.write(event_id)
+                buf.write(p3)
+                buf.write(component_id)
+                buf.write(p4)
+                buf.write(event_name)
+                buf.write(p5)
+                buf.write("\n")
             
-            # Add bindings
-            bindings = self.get_bindings()
-            if bindings:
-                script_parts.append(bindings)
+        # Add lifecycle hooks
+        buf.write(self._mount_script)
+        buf.write("\n")
             
-            # Add event handlers
-            for event_name, event_id in self.event_handlers.items():
-                handler_script = f"""
-                    document.getElementById('{self.id}').addEventListener('{event_name}', function(event) {{
-                        ScorpiUI.emit('{event_id}', {{
-                            value: event.target.value,
-                            checked: event.target.checked,
-                            type: event.type,
-                            meta: {{
-                                componentId: '{self.id}',
-                                eventName: '{event_name}'
-                            }}
-                        }});
-                    }});
-                """
-                script_parts.append(handler_script)
-                
-            # Add lifecycle hooks
-            mount_script = f"""
-                document.addEventListener('DOMContentLoaded', function() {{
-                    const element = document.getElementById('{self.id}');
-                    if (element) {{
-                        ScorpiUI.emit('{self.id}_mount');
-                    }}
-                }});
-            """
-            script_parts.append(mount_script)
-                
-            # Add custom script
-            if self.script:
-                script_parts.append(self.script)
-                
-            if script_parts:
-                return f"<script>\n{'\n'.join(script_parts)}\n</script>"
-            return ""
-        except Exception as e:
-            logger.error(f"Error generating script for component {self.id}: {str(e)}")
-            raise
+        # Add custom script
+        if self.script:
+            buf.write(self.script)
+            buf.write("\n")
+            
+        buf.write("</script>")
+        script = buf.getvalue()
+        self._script_cache = script
+        self._script_dirty = False
+        return script
     
     def get_style(self) -> str:
         """
@@ -516,16 +1003,7 @@ class Component:
         Returns:
             str: CSS styles if present, empty string otherwise
         """
-        if self.style:
-            return f"<style>\n{self.style}\n</style>"
-        return ""
-
-    def computed(self, name: str) -> Any:
-        """Get computed property value with caching."""
-        if name not in self._computed_cache:
-            if hasattr(self, f'compute_{name}'):
-                self._computed_cache[name] = getattr(self, f'compute_{name}')()
-        return self._computed_cache[name]
+        return self._style_block
 
     def __str__(self) -> str:
         """String representation of component."""
@@ -10,6 +10,8 @@ from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union
 from flask_socketio import emit
 from dataclasses import dataclass
+from ._compat import DATACLASS_SLOTS
+from ._socket import get_socketio
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,7 +19,7 @@ logger = logging.getLogger(__name__)
 # Store event handlers
 event_handlers: Dict[str, Callable] = {}
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EventData:
     """
     Container for event data with consistent structure.
@@ -38,15 +40,16 @@ class EventData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EventData':
         """Create EventData from a dictionary."""
-        if not isinstance(data, dict):
+        if data.__class__ is not dict and not isinstance(data, dict):
             return cls(value=data)
             
+        get = data.get
         return cls(
-            value=data.get('value'),
-            event_type=data.get('type', 'change'),
-            target_id=data.get('target_id'),
-            key=data.get('key'),
-            meta=data.get('meta', {})
+            get('value'),
+            get('type', 'change'),
+            get('target_id'),
+            get('key'),
+            get('meta', {})
         )
 
 def register_event(event_id: str, handler: Callable) -> Callable:
@@ -79,7 +82,7 @@ def register_event(event_id: str, handler: Callable) -> Callable:
             result = handler(*args, **kwargs)
             return result
         except Exception as e:
-            logger.error(f"Error in event handler {event_id}: {str(e)}")
+            logger.error("Error in event handler %s: %s", event_id, e)
             raise
     
     event_handlers[event_id] = wrapper
@@ -111,7 +114,7 @@ def handle_component_event(event_data: Dict[str, Any]) -> None:
             
         handler = event_handlers.get(event_id)
         if not handler:
-            logger.warning(f"No handler registered for event: {event_id}")
+            logger.warning("No handler registered for event: %s", event_id)
             return
             
         # Create EventData object and execute handler
@@ -127,24 +130,27 @@ def handle_component_event(event_data: Dict[str, Any]) -> None:
         })
         
     except Exception as e:
-        logger.error(f"Error handling component event: {str(e)}")
+        logger.error("Error handling component event: %s", e)
         emit('error', {'message': str(e)})
 
 def emit_state_change(component_id: str, state: Any) -> None:
     """
     Emit a state change event to the frontend.
     
+    The change is broadcast to all connected clients, like the batched
+    updates of ComponentState, since server-side state is shared by every
+    client; it works the same inside socket handlers, HTTP routes and
+    background tasks.
+    
     Args:
         component_id (str): ID of the component whose state changed
         state (Any): New state value
     """
+    payload = {'component_id': component_id, 'state': state}
     try:
-        emit('state_change', {
-            'component_id': component_id,
-            'state': state
-        })
+        get_socketio().emit('state_change', payload)
     except Exception as e:
-        logger.error(f"Error emitting state change: {str(e)}")
+        logger.error("Error emitting state change: %s", e)
 
 class EventMixin:
     """
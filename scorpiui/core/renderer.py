@@ -11,37 +11,135 @@ TODO:
 - Add reconnection handling
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask
 from flask_socketio import SocketIO, emit
 from scorpiui.core.events import handle_component_event
 import os
-import logging
 import json
+import logging
+import threading
+from typing import Final
+
+try:
+    import orjson
+except ImportError:  # optional; SocketIO falls back to the stdlib json module
+    orjson = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by run_app (see configure_logging), not at import
 logger = logging.getLogger(__name__)
 
-# Get the absolute paths to the templates and static directories
-template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'templates'))
-static_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static'))
+# Absolute paths to the templates and static directories, resolved once at import
+_PACKAGE_DIR: Final[str] = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_TEMPLATE_DIR: Final[str] = os.path.join(_PACKAGE_DIR, 'templates')
+_STATIC_DIR: Final[str] = os.path.join(_PACKAGE_DIR, 'static')
+template_dir = _TEMPLATE_DIR
+static_dir = _STATIC_DIR
 
 # Initialize Flask app with the correct template and static directories
 app = Flask(__name__, 
-           template_folder=template_dir,
-           static_folder=static_dir,
+           template_folder=_TEMPLATE_DIR,
+           static_folder=_STATIC_DIR,
            static_url_path='/static')
 
-# Initialize SocketIO
-socketio = SocketIO(app, cors_allowed_origins="*")
+class _OrjsonCodec:
+    """
+    json-module-compatible codec for SocketIO packets backed by orjson.
+    
+    Values orjson can't encode but the stdlib can (e.g. ints beyond 64 bits)
+    fall back to json.dumps. Decoding stays with the stdlib, since orjson
+    reads such ints back as floats and inbound event payloads are small.
+    """
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        try:
+            # python-socketio passes stdlib options such as separators;
+            # orjson's output is already compact, so they are ignored
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, *args, **kwargs)
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return json.loads(s, *args, **kwargs)
+
+# SocketIO async mode ('eventlet', 'gevent' or 'threading'). When unset,
+# Flask-SocketIO picks eventlet, then gevent, then threading, depending on
+# what is installed. eventlet and gevent serve WebSocket frames much faster
+# than the threading mode's Werkzeug server, but the application must
+# monkey-patch the standard library before importing ScorpiUI to use them.
+ASYNC_MODE: Final = os.environ.get('SCORPIUI_ASYNC_MODE') or None
 
-# Global title state
-_title_state = {
-    'base_title': 'ScorpiUI',
+# Initialize SocketIO, encoding packets with orjson when it is installed
+_socketio_options = {'cors_allowed_origins': "*", 'async_mode': ASYNC_MODE}
+if orjson is not None:
+    _socketio_options['json'] = _OrjsonCodec
+socketio = SocketIO(app, **_socketio_options)
+
+# Global title state, also sent as-is as the title_update payload. The emit
+# happens later in _flush_title, so it carries whatever the latest setter
+# call left here (latest wins); a change made during the emit schedules
+# another flush
+_TITLE_PAYLOAD = {
     'page_title': None,
+    'base_title': 'ScorpiUI',
     'separator': ' | '
 }
 
+# Full title composed from _TITLE_PAYLOAD, see _recompute_title
+_CACHED_TITLE: str = 'ScorpiUI'
+
+def _recompute_title() -> bool:
+    """
+    Recompose the cached full title from the title state.
+    
+    Returns:
+        bool: Whether the full title changed
+    """
+    global _CACHED_TITLE
+    page = _TITLE_PAYLOAD['page_title']
+    base = _TITLE_PAYLOAD['base_title']
+    title = f"{page}{_TITLE_PAYLOAD['separator']}{base}" if page else base
+    if title == _CACHED_TITLE:
+        return False
+    _CACHED_TITLE = title
+    return True
+
+# Seconds to wait before emitting a title change, so that several title
+# updates in a row (e.g. during one request) reach the clients as one frame
+_TITLE_WRITE_DELAY = 0.01
+_title_flush_scheduled = False
+_title_lock = threading.Lock()
+
+def _schedule_title_update():
+    """Emit the current title state to all clients after _TITLE_WRITE_DELAY."""
+    global _title_flush_scheduled
+    if not socketio:
+        return
+    with _title_lock:
+        if _title_flush_scheduled:
+            return
+        _title_flush_scheduled = True
+    try:
+        socketio.start_background_task(_flush_title)
+    except Exception:
+        # Let the next title change try again instead of never emitting
+        with _title_lock:
+            _title_flush_scheduled = False
+        raise
+
+def _flush_title():
+    """Send the latest title state in a single title_update emit."""
+    global _title_flush_scheduled
+    socketio.sleep(_TITLE_WRITE_DELAY)
+    # Clear the flag first: a title set during the emit schedules a new flush
+    with _title_lock:
+        _title_flush_scheduled = False
+    try:
+        socketio.emit('title_update', _TITLE_PAYLOAD)
+    except Exception as e:
+        logger.error('Error emitting title update: %s', e)
+
 def set_base_title(base_title: str, separator: str = None):
     """
     Set the base title for the entire application.
@@ -51,17 +149,12 @@ def set_base_title(base_title: str, separator: str = None):
         base_title (str): The base title for the app
         separator (str, optional): The separator between base_title and page_title
     """
-    _title_state['base_title'] = base_title
+    _TITLE_PAYLOAD['base_title'] = base_title
     if separator is not None:
-        _title_state['separator'] = separator
-    
-    # Emit title update event to all clients
-    if socketio:
-        socketio.emit('title_update', {
-            'page_title': _title_state['page_title'],
-            'base_title': base_title,
-            'separator': _title_state['separator']
-        })
+        _TITLE_PAYLOAD['separator'] = separator
+    if _recompute_title():
+        # Emit title update event to all clients
+        _schedule_title_update()
 
 def set_title(title: str):
     """
@@ -71,15 +164,10 @@ def set_title(title: str):
     Args:
         title (str): The page-specific title
     """
-    _title_state['page_title'] = title
-    
-    # Emit title update event to all clients
-    if socketio:
-        socketio.emit('title_update', {
-            'page_title': title,
-            'base_title': _title_state['base_title'],
-            'separator': _title_state['separator']
-        })
+    _TITLE_PAYLOAD['page_title'] = title
+    if _recompute_title():
+        # Emit title update event to all clients
+        _schedule_title_update()
 
 def get_title() -> str:
     """
@@ -88,26 +176,17 @@ def get_title() -> str:
     Returns:
         str: The formatted title string
     """
-    base = _title_state['base_title']
-    page = _title_state['page_title']
-    sep = _title_state['separator']
-    
-    if page:
-        return f"{page}{sep}{base}"
-    return base
+    return _CACHED_TITLE
 
-@socketio.on('connect')
 def handle_connect():
     """Handle WebSocket connection event."""
     logger.info('Client connected')
     emit('connection_response', {'status': 'connected'})
 
-@socketio.on('disconnect')
 def handle_disconnect():
     """Handle WebSocket disconnection event."""
     logger.info('Client disconnected')
 
-@socketio.on('component_event')
 def handle_socket_event(data):
     """
     Handle component events via WebSocket.
@@ -121,17 +200,42 @@ def handle_socket_event(data):
             emit('error', {'message': 'Invalid event data'})
             return
 
-        event_id = data['event_id']
-        logger.info(f'Handling event: {event_id}')
+        logger.info('Handling event: %s', data['event_id'])
         
         # Handle the event using the new handle_component_event function
         handle_component_event(data)
             
     except Exception as e:
-        logger.error(f'Error handling event: {str(e)}')
+        logger.error('Error handling event: %s', e)
         emit('error', {'message': str(e)})
 
-def run_app(port=8000, debug=True, host='127.0.0.1'):
+def _register_handlers(sio: SocketIO):
+    """
+    Register the ScorpiUI WebSocket event handlers on a SocketIO server.
+    
+    Args:
+        sio (SocketIO): Server to register the handlers on
+    """
+    sio.on('connect')(handle_connect)
+    sio.on('disconnect')(handle_disconnect)
+    sio.on('component_event')(handle_socket_event)
+
+_handlers_registered = False
+
+def init_socketio():
+    """
+    Register the WebSocket event handlers on the module's socketio server.
+    
+    Called by run_app; applications that serve ``app``/``socketio`` some
+    other way (e.g. a production WSGI server) must call it themselves.
+    Calling it more than once has no further effect.
+    """
+    global _handlers_registered
+    if not _handlers_registered:
+        _register_handlers(socketio)
+        _handlers_registered = True
+
+def run_app(port=8000, debug=True, host='127.0.0.1', configure_logging=True):
     """
     Start the Flask-SocketIO development server.
     
@@ -139,10 +243,20 @@ def run_app(port=8000, debug=True, host='127.0.0.1'):
         port (int): Port number to run the server on (default: 8000)
         debug (bool): Enable debug mode (default: True)
         host (str): Host to run the server on (default: '127.0.0.1')
+        configure_logging (bool): Set up INFO-level root logging with
+            logging.basicConfig; pass False to keep the application's own
+            logging configuration (default: True)
     """
+    if configure_logging:
+        logging.basicConfig(level=logging.INFO)
+    init_socketio()
+    options = {}
+    if socketio.async_mode == 'gevent':
+        # The reloader doesn't work with gevent's patched standard library
+        options['use_reloader'] = False
     try:
-        logger.info(f'Starting ScorpiUI server on {host}:{port}')
-        socketio.run(app, debug=debug, port=port, host=host)
+        logger.info('Starting ScorpiUI server on %s:%s (%s)', host, port, socketio.async_mode)
+        socketio.run(app, debug=debug, port=port, host=host, **options)
     except Exception as e:
-        logger.error(f'Failed to start server: {str(e)}')
+        logger.error('Failed to start server: %s', e)
         raise
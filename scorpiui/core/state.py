@@ -6,15 +6,74 @@ It follows a similar pattern to Flutter's state management, with observable stat
 and automatic UI updates when state changes.
 """
 
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional
 from dataclasses import dataclass, field
-import uuid
+from ._compat import DATACLASS_SLOTS
+from ._socket import get_socketio
+import itertools
 import logging
-from flask_socketio import emit
+import threading
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Process-wide sources of notifier and subscription IDs; these are internal
+# handles, so a counter is enough to keep them unique
+_notifier_ids = itertools.count()
+_subscriber_ids = itertools.count()
+
+# Seconds to collect component state changes before sending them to the
+# clients as a single state_change_batch frame
+CLIENT_WRITE_DELAY = 0.01
+
+# component_id -> latest state_change payload not yet sent to the clients
+_pending_state_changes: Dict[str, Any] = {}
+_pending_lock = threading.Lock()
+_flush_scheduled = False
+
+def _has_clients() -> bool:
+    """Check whether any client is connected to the default namespace."""
+    server = get_socketio().server
+    return server is not None and bool(server.manager.rooms.get('/'))
+
+def _queue_state_change(payload: Dict[str, Any]) -> None:
+    """
+    Queue a component state change for the next batched emit.
+    
+    Only the latest payload of each component is kept, so a burst of updates
+    to one component is sent as a single entry.
+    
+    Args:
+        payload: Dict with the 'component_id' and new 'state' of a component
+    """
+    global _flush_scheduled
+    with _pending_lock:
+        _pending_state_changes[payload['component_id']] = payload
+        if _flush_scheduled:
+            return
+        _flush_scheduled = True
+    try:
+        get_socketio().start_background_task(_flush_state_changes)
+    except Exception:
+        # Let the next change try again instead of queueing forever
+        with _pending_lock:
+            _flush_scheduled = False
+        raise
+
+def _flush_state_changes() -> None:
+    """Wait CLIENT_WRITE_DELAY, then send all queued state changes in one emit."""
+    global _pending_state_changes, _flush_scheduled
+    socketio = get_socketio()
+    socketio.sleep(CLIENT_WRITE_DELAY)
+    with _pending_lock:
+        pending = _pending_state_changes
+        _pending_state_changes = {}
+        _flush_scheduled = False
+    try:
+        socketio.emit('state_change_batch', list(pending.values()))
+    except Exception as e:
+        logger.error("Error emitting state changes: %s", e)
+
+@dataclass(**DATACLASS_SLOTS)
 class StateSubscriber:
     """A subscriber to state changes."""
     id: str
@@ -25,10 +84,15 @@ class StateNotifier:
     A notifier that manages state and notifies subscribers of changes.
     Similar to Flutter's ChangeNotifier.
     """
+    __slots__ = ('_state', '_callbacks', '_callback_ids', '_id')
+    
     def __init__(self, initial_state: Any = None):
         self._state = initial_state
-        self._subscribers: Dict[str, StateSubscriber] = {}
-        self._id = uuid.uuid4().hex
+        # Subscriber callbacks in subscription order; unsubscribed slots are
+        # set to None and compacted away once they make up half the list
+        self._callbacks: List[Optional[Callable[[Any], None]]] = []
+        self._callback_ids: Dict[str, int] = {}
+        self._id = str(next(_notifier_ids))
 
     @property
     def state(self) -> Any:
@@ -42,7 +106,7 @@ class StateNotifier:
         Args:
             new_state: The new state value
         """
-        if new_state == self._state:
+        if new_state is self._state or new_state == self._state:
             return
 
         self._state = new_state
@@ -68,8 +132,9 @@ class StateNotifier:
         Returns:
             str: Subscription ID
         """
-        subscriber_id = uuid.uuid4().hex
-        self._subscribers[subscriber_id] = StateSubscriber(subscriber_id, callback)
+        subscriber_id = str(next(_subscriber_ids))
+        self._callback_ids[subscriber_id] = len(self._callbacks)
+        self._callbacks.append(callback)
         return subscriber_id
 
     def unsubscribe(self, subscriber_id: str) -> None:
@@ -79,36 +144,60 @@ class StateNotifier:
         Args:
             subscriber_id: ID of the subscription to remove
         """
-        if subscriber_id in self._subscribers:
-            del self._subscribers[subscriber_id]
+        index = self._callback_ids.pop(subscriber_id, None)
+        if index is None:
+            return
+        self._callbacks[index] = None
+        if len(self._callback_ids) * 2 <= len(self._callbacks):
+            self._compact_callbacks()
+
+    def _compact_callbacks(self) -> None:
+        """Drop unsubscribed slots from the callback list and reindex the IDs."""
+        callbacks = self._callbacks
+        ids = sorted(self._callback_ids.items(), key=lambda item: item[1])
+        self._callbacks = [callbacks[index] for _, index in ids]
+        self._callback_ids = {subscriber_id: i for i, (subscriber_id, _) in enumerate(ids)}
 
     def _notify_subscribers(self) -> None:
         """Notify all subscribers of state change."""
-        for subscriber in self._subscribers.values():
-            try:
-                subscriber.callback(self._state)
-            except Exception as e:
-                logger.error(f"Error notifying subscriber {subscriber.id}: {str(e)}")
+        if not self._callbacks:
+            return
+        state = self._state
+        for callback in self._callbacks:
+            if callback is not None:
+                try:
+                    callback(state)
+                except Exception as e:
+                    logger.error("Error notifying subscriber %r: %s", callback, e)
 
 class ComponentState(StateNotifier):
     """
     State management for UI components with WebSocket integration.
     Automatically emits state changes to connected clients.
+    
+    Changes are broadcast to all connected clients in batched
+    state_change_batch frames, matching events.emit_state_change.
     """
+    __slots__ = ('component_id', '_payload')
+    
     def __init__(self, component_id: str, initial_state: Any = None):
         super().__init__(initial_state)
         self.component_id = component_id
+        # Reused state_change payload. It is emitted later by the batch flush
+        # task, so a change made before the flush overwrites the queued
+        # state (latest wins); a change made during the emit is queued again
+        self._payload = {'component_id': component_id, 'state': initial_state}
 
     def _notify_subscribers(self) -> None:
-        """Notify subscribers and emit state change via WebSocket."""
+        """Notify subscribers and queue the state change for the clients."""
         super()._notify_subscribers()
         try:
-            emit('state_change', {
-                'component_id': self.component_id,
-                'state': self._state
-            })
+            if _has_clients():
+                payload = self._payload
+                payload['state'] = self._state
+                _queue_state_change(payload)
         except Exception as e:
-            logger.error(f"Error emitting state change: {str(e)}")
+            logger.error("Error emitting state change: %s", e)
 
 @dataclass
 class GlobalState:
@@ -4,12 +4,50 @@ State Binding Module
 This module provides utilities for binding component states to DOM elements.
 """
 
-from jinja2 import Template
+from functools import lru_cache
+
+# JavaScript templates for the bindings, %-formatted with the state name,
+# target element ID and, where needed, one extra argument
+_TEXT_JS = "ScorpiUI.onStateChange('%s',function(newState){document.getElementById('%s').textContent=newState;});"
+_VALUE_JS = "ScorpiUI.onStateChange('%s',function(newState){document.getElementById('%s').value=newState;});"
+_ATTRIBUTE_JS = "ScorpiUI.onStateChange('%s',function(newState){document.getElementById('%s').setAttribute('%s',newState);});"
+_STYLE_JS = "ScorpiUI.onStateChange('%s',function(newState){document.getElementById('%s').style['%s']=newState;});"
+_TRANSFORM_JS = "ScorpiUI.onStateChange('%s',function(newState){document.getElementById('%s').textContent=%s(newState);});"
+
+# The generated code only depends on the arguments, and the same bindings are
+# typically created again on every render, so the results are memoized
+
+@lru_cache(maxsize=1024)
+def bind_to_text(state_name, target_id):
+    """Generate the JavaScript binding a state to an element's text content."""
+    return _TEXT_JS % (state_name, target_id)
+
+@lru_cache(maxsize=1024)
+def bind_to_value(state_name, target_id):
+    """Generate the JavaScript binding a state to an input element's value."""
+    return _VALUE_JS % (state_name, target_id)
+
+@lru_cache(maxsize=1024)
+def bind_to_attribute(state_name, target_id, attribute):
+    """Generate the JavaScript binding a state to an element attribute."""
+    return _ATTRIBUTE_JS % (state_name, target_id, attribute)
+
+@lru_cache(maxsize=1024)
+def bind_to_style(state_name, target_id, style_property):
+    """Generate the JavaScript binding a state to an element style property."""
+    return _STYLE_JS % (state_name, target_id, style_property)
+
+@lru_cache(maxsize=1024)
+def bind_with_transform(state_name, target_id, transform_function):
+    """Generate the JavaScript binding a state to an element's text through a transform."""
+    return _TRANSFORM_JS % (state_name, target_id, transform_function)
 
 class StateBinding:
     """
     Manages state bindings between components and DOM elements.
     Automatically generates the necessary JavaScript code for state updates.
+    
+    The methods delegate to the memoized module-level functions.
     """
     
     @staticmethod
@@ -24,11 +62,7 @@ class StateBinding:
         Returns:
             str: JavaScript code for the binding
         """
-        return f"""
-            ScorpiUI.onStateChange('{state_name}', function(newState) {{
-                document.getElementById('{target_id}').textContent = newState;
-            }});
-        """
+        return bind_to_text(state_name, target_id)
     
     @staticmethod
     def bind_to_value(state_name, target_id):
@@ -42,11 +76,7 @@ class StateBinding:
         Returns:
             str: JavaScript code for the binding
         """
-        return f"""
-            ScorpiUI.onStateChange('{state_name}', function(newState) {{
-                document.getElementById('{target_id}').value = newState;
-            }});
-        """
+        return bind_to_value(state_name, target_id)
     
     @staticmethod
     def bind_to_attribute(state_name, target_id, attribute):
@@ -61,11 +91,7 @@ class StateBinding:
         Returns:
             str: JavaScript code for the binding
         """
-        return f"""
-            ScorpiUI.onStateChange('{state_name}', function(newState) {{
-                document.getElementById('{target_id}').setAttribute('{attribute}', newState);
-            }});
-        """
+        return bind_to_attribute(state_name, target_id, attribute)
     
     @staticmethod
     def bind_to_style(state_name, target_id, style_property):
@@ -80,11 +106,7 @@ class StateBinding:
         Returns:
             str: JavaScript code for the binding
         """
-        return f"""
-            ScorpiUI.onStateChange('{state_name}', function(newState) {{
-                document.getElementById('{target_id}').style['{style_property}'] = newState;
-            }});
-        """
+        return bind_to_style(state_name, target_id, style_property)
     
     @staticmethod
     def bind_with_transform(state_name, target_id, transform_function):
@@ -99,8 +121,4 @@ class StateBinding:
         Returns:
             str: JavaScript code for the binding
         """
-        return f"""
-            ScorpiUI.onStateChange('{state_name}', function(newState) {{
-                document.getElementById('{target_id}').textContent = {transform_function}(newState);
-            }});
-        """
+        return bind_with_transform(state_name, target_id, transform_function)
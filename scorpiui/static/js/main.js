@@ -47,6 +47,14 @@ window.ScorpiUI = {
             this.handleStateChange(component_id, state);
         });
 
+        // Component state changes coalesced by the server into one frame
+        this.socket.on('state_change_batch', (changes) => {
+            console.log('State change batch:', changes);
+            changes.forEach(({ component_id, state }) => {
+                this.handleStateChange(component_id, state);
+            });
+        });
+
         this.socket.on('title_update', (data) => {
             console.log('Title update:', data);
             this.updateTitle(data.page_title, data.base_title, data.separator);
@@ -30,6 +30,10 @@ setup(
         'Flask>=2.0',
         'Jinja2>=3.0',
     ],
+    extras_require={
+        # Faster encoding of WebSocket payloads
+        'orjson': ['orjson>=3.0'],
+    },
     project_urls={
         'Bug Tracker': 'https://github.com/venopyx/scorpiui/issues',
         'Source': 'https://github.com/venopyx/scorpiui',